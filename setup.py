@@ -22,7 +22,7 @@ CLASSIFIERS = [
 INSTALL_REQUIRES = (
     ["numpy>=1.9", "matplotlib>=2.0", "xarray>=0.14.1", "custom_inherit>=2.2"],
 )
-TESTS_REQUIRE = ["pytest >= 3.8", "hypothesis >= 4.22.3"]
+TESTS_REQUIRE = ["pytest >= 3.8", "hypothesis >= 5.0.0", "numpy >= 1.17"]
 
 DESCRIPTION = "A simple tool for logging and plotting measurements when training a neural network."
 LONG_DESCRIPTION = """
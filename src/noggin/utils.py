@@ -1,6 +1,6 @@
 from collections import OrderedDict, defaultdict, namedtuple
 from pathlib import Path
-from typing import Dict, Optional, Tuple, Union
+from typing import BinaryIO, Dict, Optional, Tuple, Union
 
 import numpy as np
 from custom_inherit import doc_inherit
@@ -76,7 +76,7 @@ def create_plot(
 
 
 def save_metrics(
-    path: Union[str, Path],
+    path: Union[str, Path, BinaryIO],
     liveplot: Optional[Union[LivePlot, LiveLogger]] = None,
     *,
     train_metrics: LiveMetrics = None,
@@ -87,8 +87,10 @@ def save_metrics(
 
         Parameters
         ----------
-        path: PathLike
-           The file-path used to save the archive. E.g. 'path/to/saved_metrics.npz'
+        path: Union[PathLike, BinaryIO]
+           The file-path used to save the archive. E.g. 'path/to/saved_metrics.npz'.
+           An open, writable binary file-object (e.g. ``io.BytesIO``) can be
+           supplied instead.
 
         liveplot : Optional[noggin.LivePlot]
            The LivePlot instance whose metrics will be saves.
@@ -126,26 +128,30 @@ def save_metrics(
         for name, metric in metrics.items():
             save_dict.update({sep.join((type_, name, k)): v for k, v in metric.items()})
 
-    with open(path, "wb") as f:
-        np.savez(
-            f,
-            train_order=list(train_metrics),
-            test_order=list(test_metrics),
-            sep=sep,
-            **save_dict
-        )
+    save_dict.update(
+        train_order=list(train_metrics), test_order=list(test_metrics), sep=sep
+    )
+
+    if hasattr(path, "write"):
+        np.savez(path, **save_dict)
+    else:
+        with open(path, "wb") as f:
+            np.savez(f, **save_dict)
 
 
 metrics = namedtuple("metrics", ["train", "test"])
 
 
-def load_metrics(path: Union[str, Path]) -> Tuple[LiveMetrics, LiveMetrics]:
+def load_metrics(
+    path: Union[str, Path, BinaryIO]
+) -> Tuple[LiveMetrics, LiveMetrics]:
     """ Load noggin metrics from a numpy archive.
 
         Parameters
         ----------
-        path : PathLike
-            Path to numpy archive.
+        path : Union[PathLike, BinaryIO]
+            Path to numpy archive, or an open, readable binary file-object
+            containing the archive.
 
         Returns
         -------
@@ -1,5 +1,6 @@
 import os
 import tempfile
+from uuid import uuid4
 
 import matplotlib.pyplot as plt
 import pytest
@@ -12,25 +13,40 @@ settings.register_profile("debug", max_examples=10, verbosity=Verbosity.verbose)
 settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", "default"))
 
 
-@pytest.fixture()
-def cleandir() -> str:
-    """ This fixture will use the stdlib `tempfile` module to
-    move the current working directory to a tmp-dir for the
-    duration of the test.
-
-    Afterwards, the session returns to its previous working
-    directory, and the temporary directory and its contents
-    are removed.
+@pytest.fixture(scope="session")
+def _tmp_root() -> str:
+    """ A single temporary directory, created via the stdlib
+    `tempfile` module, that is shared for the entire test session.
+    It and its contents are removed at the end of the session.
 
     Yields
     ------
     str
         The name of the temporary directory."""
     with tempfile.TemporaryDirectory() as tmpdirname:
-        old_dir = os.getcwd()
-        os.chdir(tmpdirname)
         yield tmpdirname
-        os.chdir(old_dir)
+
+
+@pytest.fixture()
+def cleandir(_tmp_root: str) -> str:
+    """ This fixture will move the current working directory to
+    a fresh, uniquely-named sub-directory of the session's tmp-dir
+    for the duration of the test.
+
+    Afterwards, the session returns to its previous working
+    directory. The sub-directory and its contents are removed
+    along with the session's tmp-dir.
+
+    Yields
+    ------
+    str
+        The name of the temporary sub-directory."""
+    tmpdirname = os.path.join(_tmp_root, uuid4().hex)
+    os.mkdir(tmpdirname)
+    old_dir = os.getcwd()
+    os.chdir(tmpdirname)
+    yield tmpdirname
+    os.chdir(old_dir)
 
 
 @pytest.fixture(scope="session", autouse=True)
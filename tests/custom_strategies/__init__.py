@@ -1,9 +1,7 @@
 import pprint
-from collections import defaultdict
 from itertools import combinations
 from typing import Any, Dict, Optional, Sequence, Union, Tuple, TypeVar
 
-import hypothesis.extra.numpy as hnp
 import hypothesis.strategies as st
 import numpy as np
 from matplotlib import colors
@@ -23,6 +21,8 @@ __all__ = [
 
 T = TypeVar("T")
 
+_METRIC_NAMES = ("metric_a", "metric_b", "metric_c")
+
 
 def draw_if_strategy(
     data: st.DataObject,
@@ -34,32 +34,34 @@ def draw_if_strategy(
     return value
 
 
-a_bunch_of_colors = list(colors.BASE_COLORS.keys())
-a_bunch_of_colors.extend(colors.BASE_COLORS.values())
-a_bunch_of_colors.extend(colors.CSS4_COLORS.keys())
-a_bunch_of_colors.extend(colors.CSS4_COLORS.values())
-a_bunch_of_colors.extend(["C{}".format(i) for i in range(10)])
-a_bunch_of_colors.append((1.0, 0.0, 0.0, 0.5))
-a_bunch_of_colors.append(None)
+a_bunch_of_colors = (
+    *colors.BASE_COLORS.keys(),
+    *colors.BASE_COLORS.values(),
+    *colors.CSS4_COLORS.keys(),
+    *colors.CSS4_COLORS.values(),
+    *("C{}".format(i) for i in range(10)),
+    (1.0, 0.0, 0.0, 0.5),
+    None,
+)
 
+_COLOR_STRATEGY = st.sampled_from(a_bunch_of_colors)
 
-def plot_kwargs() -> st.SearchStrategy[Dict[str, Any]]:
-    def _filter_key_if_none(d: dict):
-        return {k: v for k, v in d.items() if v is not None}
 
+def plot_kwargs() -> st.SearchStrategy[Dict[str, Any]]:
     return st.fixed_dictionaries(
-        dict(
-            figsize=st.none() | st.tuples(*[st.floats(min_value=1, max_value=10)] * 2),
-            max_fraction_spent_plotting=st.none() | st.floats(0.0, 1.0),
-            last_n_batches=st.none() | st.integers(1, 10),
-            nrows=st.none() | st.integers(1, 3),
-            ncols=st.none() | st.integers(1, 3),
-        )
-    ).map(_filter_key_if_none)
+        {},
+        optional=dict(
+            figsize=st.tuples(*[st.floats(min_value=1, max_value=10)] * 2),
+            max_fraction_spent_plotting=st.floats(0.0, 1.0),
+            last_n_batches=st.integers(1, 10),
+            nrows=st.integers(1, 3),
+            ncols=st.integers(1, 3),
+        ),
+    )
 
 
 def matplotlib_colors() -> st.SearchStrategy[ValidColor]:
-    return st.sampled_from(a_bunch_of_colors)
+    return _COLOR_STRATEGY
 
 
 def everything_except(
@@ -72,11 +74,14 @@ def everything_except(
     )
 
 
-def finite_arrays(size):
-    return hnp.arrays(
-        shape=(size,),
-        dtype=np.float64,
-        elements=st.floats(min_value=-1e6, max_value=1e6),
+def finite_arrays(size: int) -> st.SearchStrategy[np.ndarray]:
+    """Draws a seed and uses numpy to generate the array in bulk; generating
+    arrays element-by-element via hypothesis is slow and the consumers of this
+    strategy only need some finite float-array of the specified size."""
+    if size == 0:
+        return st.just(np.empty(0, dtype=np.float64))
+    return st.integers(0, 2 ** 32 - 1).map(
+        lambda seed: np.random.default_rng(seed).uniform(-1e6, 1e6, size)
     )
 
 
@@ -99,14 +104,17 @@ def metric_dict(
         num_epoch_data = draw(st.integers(0, num_batch_data))
 
     if epoch_domain is None:
-        epoch_domain = draw(
-            choices(np.arange(1, num_batch_data + 1), size=num_epoch_data)
+        rng = np.random.default_rng(draw(st.integers(0, 2 ** 32 - 1)))
+        epoch_domain = rng.choice(
+            np.arange(1, num_batch_data + 1), size=num_epoch_data, replace=False
         )
 
     out = dict(name=name)  # type: Dict[str, np.ndarray]
     out["batch_data"] = draw(finite_arrays(num_batch_data))  # type: np.ndarray
     out["epoch_data"] = draw(finite_arrays(num_epoch_data))  # type: np.ndarray
-    out["epoch_domain"] = np.asarray(sorted(epoch_domain))
+    out["epoch_domain"] = np.sort(
+        np.fromiter(epoch_domain, count=len(epoch_domain), dtype=np.int64)
+    )
     out["cnt_since_epoch"] = draw(st.integers(0, num_batch_data - num_epoch_data))
     out["total_weighting"] = (
         draw(st.floats(0.0, 10.0)) if out["cnt_since_epoch"] else 0.0
@@ -123,14 +131,14 @@ def live_metrics(draw, min_num_metrics=0) -> st.SearchStrategy[LiveMetrics]:
     num_batch_data = draw(st.integers(0, 5))
     num_epoch_data = draw(st.integers(0, num_batch_data))
 
-    out = defaultdict(dict)  # type: Dict[str, Dict[str, np.ndarray]]
-    for name in ["metric_a", "metric_b", "metric_c"][:num_metrics]:
+    out = {}  # type: Dict[str, Dict[str, np.ndarray]]
+    for name in _METRIC_NAMES[:num_metrics]:
         out[name] = draw(
             metric_dict(
                 name, num_batch_data=num_batch_data, num_epoch_data=num_epoch_data
             )
         )
-    return dict(out.items())
+    return out
 
 
 def verbose_repr(self):
@@ -163,26 +171,30 @@ class VerbosePlotter(LivePlot):
         return verbose_repr(self)
 
 
+def _sizes(metrics: LiveMetrics) -> Tuple[int, int]:
+    """Returns the max number of epoch and batch datapoints among the
+    metrics, computed in a single pass."""
+    num_epoch = num_batch = 0
+    for v in metrics.values():
+        num_epoch = max(num_epoch, len(v["epoch_data"]))
+        num_batch = max(num_batch, len(v["batch_data"]))
+    return num_epoch, num_batch
+
+
 @st.composite
 def loggers(draw, min_num_metrics=0) -> st.SearchStrategy[LiveLogger]:
     train_metrics = draw(live_metrics(min_num_metrics=min_num_metrics))
     test_metrics = draw(live_metrics(min_num_metrics=min_num_metrics))
+    num_train_epoch, num_train_batch = _sizes(train_metrics)
+    num_test_epoch, num_test_batch = _sizes(test_metrics)
     return VerboseLogger.from_dict(
         dict(
             train_metrics=train_metrics,
             test_metrics=test_metrics,
-            num_train_epoch=max(
-                (len(v["epoch_data"]) for v in train_metrics.values()), default=0
-            ),
-            num_train_batch=max(
-                (len(v["batch_data"]) for v in train_metrics.values()), default=0
-            ),
-            num_test_epoch=max(
-                (len(v["epoch_data"]) for v in test_metrics.values()), default=0
-            ),
-            num_test_batch=max(
-                (len(v["batch_data"]) for v in test_metrics.values()), default=0
-            ),
+            num_train_epoch=num_train_epoch,
+            num_train_batch=num_train_batch,
+            num_test_epoch=num_test_epoch,
+            num_test_batch=num_test_batch,
         )
     )
 
@@ -195,23 +207,17 @@ def plotters(draw) -> st.SearchStrategy[LivePlot]:
     metric_names = sorted(set(train_metrics).union(set(test_metrics)))
     train_colors = {k: draw(matplotlib_colors()) for k in train_metrics}
     test_colors = {k: draw(matplotlib_colors()) for k in test_metrics}
+    num_train_epoch, num_train_batch = _sizes(train_metrics)
+    num_test_epoch, num_test_batch = _sizes(test_metrics)
 
     return LivePlot.from_dict(
         dict(
             train_metrics=train_metrics,
             test_metrics=test_metrics,
-            num_train_epoch=max(
-                (len(v["epoch_data"]) for v in train_metrics.values()), default=0
-            ),
-            num_train_batch=max(
-                (len(v["batch_data"]) for v in train_metrics.values()), default=0
-            ),
-            num_test_epoch=max(
-                (len(v["epoch_data"]) for v in test_metrics.values()), default=0
-            ),
-            num_test_batch=max(
-                (len(v["batch_data"]) for v in test_metrics.values()), default=0
-            ),
+            num_train_epoch=num_train_epoch,
+            num_train_batch=num_train_batch,
+            num_test_epoch=num_test_epoch,
+            num_test_batch=num_test_batch,
             max_fraction_spent_plotting=draw(st.floats(0, 1)),
             last_n_batches=draw(st.none() | st.integers(1, 100)),
             pltkwargs=dict(figsize=(3, 2), nrows=len(metric_names), ncols=1),
@@ -1,10 +1,13 @@
 import tests.custom_strategies as cst
+import string
+from io import BytesIO
 from typing import List
+from uuid import uuid4
 
 import hypothesis.strategies as st
 import numpy as np
 import pytest
-from hypothesis import note, given, settings
+from hypothesis import Phase, note, given, settings
 from hypothesis.stateful import (
     RuleBasedStateMachine,
     initialize,
@@ -19,6 +22,9 @@ from noggin import load_metrics, save_metrics
 from noggin.logger import LiveLogger, LiveMetric
 from tests.utils import compare_all_metrics
 
+# a metric value, reported either as a float or as a 0D array
+_SCALAR_OR_ARRAY = st.floats(-1, 1) | st.floats(-1, 1).map(np.array)
+
 
 def test_trivial_case():
     """ Perform a trivial sanity check on live logger"""
@@ -34,19 +40,21 @@ def test_trivial_case():
     )
 
 
-@settings(deadline=None)
+@settings(deadline=None, phases=[Phase.generate])
 @given(logger=cst.loggers(), data=st.data())
 def test_set_batch_missing_metric(logger: LiveLogger, data: st.DataObject):
     keys = list(logger.train_metrics) + list(logger.test_metrics)
 
     missing_metrics = data.draw(
-        st.text().filter(lambda x: x not in set(keys)).map(lambda x: {x: 2})
+        st.text(alphabet=string.ascii_lowercase, max_size=6)
+        .filter(lambda x: x not in set(keys))
+        .map(lambda x: {x: 2})
     )
     logger.set_train_batch(metrics=missing_metrics, batch_size=1)
     logger.set_test_batch(metrics=missing_metrics, batch_size=1)
 
 
-@settings(deadline=None)
+@settings(deadline=None, phases=[Phase.generate])
 @given(logger=cst.loggers())
 def test_fuzz_set_epoch(logger: LiveLogger):
     logger.set_train_epoch()
@@ -73,6 +81,12 @@ class LiveLoggerStateMachine(RuleBasedStateMachine):
         self.train_batch_set = False
         self.test_batch_set = False
         self.num_train_batch = 0
+        # whether the train/test metrics may have changed since last compared;
+        # rules that should be free of side effects set these too, so that they
+        # are always followed by a comparison
+        self._train_dirty = False
+        self._test_dirty = False
+        self._saved_metrics_to_file = False
 
     @initialize(num_train_metrics=st.integers(0, 3), num_test_metrics=st.integers(0, 3))
     def choose_metrics(self, num_train_metrics: int, num_test_metrics: int):
@@ -91,6 +105,8 @@ class LiveLoggerStateMachine(RuleBasedStateMachine):
     def get_repr(self):
         """ Ensure no side effect """
         repr(self.logger)
+        self._train_dirty = True
+        self._test_dirty = True
 
     @rule(batch_size=st.integers(0, 2), data=st.data())
     def set_train_batch(self, batch_size: int, data: SearchStrategy):
@@ -98,10 +114,9 @@ class LiveLoggerStateMachine(RuleBasedStateMachine):
             self.num_train_batch += 1
 
         self.train_batch_set = True
+        self._train_dirty = True
         batch = {
-            metric.name: data.draw(
-                st.floats(-1, 1) | st.floats(-1, 1).map(np.array), label=metric.name
-            )
+            metric.name: data.draw(_SCALAR_OR_ARRAY, label=metric.name)
             for metric in self.train_metrics
         }
         self.logger.set_train_batch(metrics=batch, batch_size=batch_size)
@@ -111,6 +126,7 @@ class LiveLoggerStateMachine(RuleBasedStateMachine):
 
     @rule()
     def set_train_epoch(self):
+        self._train_dirty = True
         self.logger.set_train_epoch()
         for metric in self.train_metrics:
             metric.set_epoch_datapoint()
@@ -118,10 +134,9 @@ class LiveLoggerStateMachine(RuleBasedStateMachine):
     @rule(batch_size=st.integers(0, 2), data=st.data())
     def set_test_batch(self, batch_size: int, data: SearchStrategy):
         self.test_batch_set = True
+        self._test_dirty = True
         batch = {
-            metric.name: data.draw(
-                st.floats(-1, 1) | st.floats(-1, 1).map(np.array), label=metric.name
-            )
+            metric.name: data.draw(_SCALAR_OR_ARRAY, label=metric.name)
             for metric in self.test_metrics
         }
         self.logger.set_test_batch(metrics=batch, batch_size=batch_size)
@@ -131,6 +146,7 @@ class LiveLoggerStateMachine(RuleBasedStateMachine):
 
     @rule()
     def set_test_epoch(self):
+        self._test_dirty = True
         self.logger.set_test_epoch()
 
         # align test-epoch with train domain
@@ -144,20 +160,28 @@ class LiveLoggerStateMachine(RuleBasedStateMachine):
     @precondition(lambda self: self.train_batch_set)
     @invariant()
     def compare_train_metrics(self):
+        if not self._train_dirty:
+            return
+
         logged_metrics = self.logger.train_metrics
-        expected_metrics = dict(
-            (metric.name, metric.to_dict()) for metric in self.train_metrics
-        )
+        expected_metrics = {
+            metric.name: metric.to_dict() for metric in self.train_metrics
+        }
         compare_all_metrics(logged_metrics, expected_metrics)
+        self._train_dirty = False
 
     @precondition(lambda self: self.test_batch_set)
     @invariant()
     def compare_test_metrics(self):
+        if not self._test_dirty:
+            return
+
         logged_metrics = self.logger.test_metrics
-        expected_metrics = dict(
-            (metric.name, metric.to_dict()) for metric in self.test_metrics
-        )
+        expected_metrics = {
+            metric.name: metric.to_dict() for metric in self.test_metrics
+        }
         compare_all_metrics(logged_metrics, expected_metrics)
+        self._test_dirty = False
 
     @invariant()
     def check_from_dict_roundtrip(self):
@@ -185,21 +209,30 @@ class LiveLoggerStateMachine(RuleBasedStateMachine):
     def check_metric_io(self, save_via_live_object: bool):
         """Ensure the saving/loading metrics always produces self-consistent
         results with the logger"""
-        from uuid import uuid4
+        if self._saved_metrics_to_file:
+            # avoid disk I/O once the file-path code path has been exercised
+            file = BytesIO()
+        else:
+            file = str(uuid4())
+            self._saved_metrics_to_file = True
 
-        filename = str(uuid4())
         if save_via_live_object:
-            save_metrics(filename, liveplot=self.logger)
+            save_metrics(file, liveplot=self.logger)
         else:
             save_metrics(
-                filename,
+                file,
                 train_metrics=self.logger.train_metrics,
                 test_metrics=self.logger.test_metrics,
             )
-        io_train_metrics, io_test_metrics = load_metrics(filename)
+
+        if isinstance(file, BytesIO):
+            file.seek(0)
+        io_train_metrics, io_test_metrics = load_metrics(file)
 
         compare_all_metrics(io_train_metrics, self.logger.train_metrics)
         compare_all_metrics(io_test_metrics, self.logger.test_metrics)
+        self._train_dirty = True
+        self._test_dirty = True
 
 
 @pytest.mark.usefixtures("cleandir")
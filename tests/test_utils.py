@@ -1,4 +1,5 @@
 import string
+from io import BytesIO
 
 import hypothesis.strategies as st
 import numpy as np
@@ -169,6 +170,23 @@ def test_metric_io_test(metric_name: str):
             assert expected == actual
 
 
+@example(metric_name="a;a")  # tests separator collision
+@given(metric_name=st.text(alphabet=string.printable, min_size=1))
+def test_metric_io_file_object(metric_name: str):
+    logger = LiveLogger()
+    logger.set_train_batch({metric_name: 1}, batch_size=1)
+    logger.set_test_batch({metric_name: 2}, batch_size=1)
+    file = BytesIO()
+    save_metrics(file, liveplot=logger)
+    file.seek(0)
+    train, test = load_metrics(file)
+
+    assert list(train) == list(logger.train_metrics)
+    assert list(test) == list(logger.test_metrics)
+    compare_all_metrics(train, logger.train_metrics)
+    compare_all_metrics(test, logger.test_metrics)
+
+
 @settings(deadline=None)
 @given(bad_logger=cst.everything_except(LiveLogger))
 def test_plot_logger_validation(bad_logger):